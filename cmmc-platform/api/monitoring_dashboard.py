@@ -13,14 +13,154 @@ Features:
 - Alert notifications
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Awaitable, Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime, timedelta
 from enum import Enum
+import asyncio
+import functools
+import inspect
+import json
+import os
+import time
 import asyncpg
 import logging
 
+# Optional imports - gracefully handle missing dependencies
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Dashboard results are served from an in-process cache for a few seconds so
+# that many auto-refreshing clients collapse into one query per interval.
+# Set DASHBOARD_CACHE_TTL_SECONDS=0 to disable.
+DASHBOARD_CACHE_TTL_SECONDS = float(os.getenv("DASHBOARD_CACHE_TTL_SECONDS", "10"))
+DASHBOARD_CACHE_MAX_ENTRIES = 1024
+
+_dashboard_cache: Dict[Tuple, Tuple[float, Any]] = {}
+_dashboard_inflight: Dict[Tuple, asyncio.Future] = {}
+# Bumped by invalidate_dashboard_cache so queries already running when a
+# write happens do not store their (pre-write) results
+_dashboard_generation = 0
+
+
+class _LeaderCancelled(Exception):
+    """The caller running a shared dashboard query was cancelled; waiters retry"""
+
+
+def invalidate_dashboard_cache() -> None:
+    """Drop all cached dashboard results (call after writes that change them)"""
+    global _dashboard_generation
+    _dashboard_generation += 1
+    _dashboard_cache.clear()
+    _dashboard_inflight.clear()
+
+
+def ttl_cached(func):
+    """
+    Cache a dashboard query for DASHBOARD_CACHE_TTL_SECONDS.
+
+    The database connection (or pool) argument is excluded from the cache
+    key, and concurrent callers for the same key share a single in-flight
+    query. The query runs on the first caller's connection; if that caller
+    is cancelled, the others retry rather than being cancelled with it.
+    """
+    signature = inspect.signature(func)
+    conn_param = list(signature.parameters)[1]
+
+    @functools.wraps(func)
+    async def wrapper(scope_id: str, conn: asyncpg.Connection, *args, **kwargs):
+        if DASHBOARD_CACHE_TTL_SECONDS <= 0:
+            return await func(scope_id, conn, *args, **kwargs)
+
+        # Key on bound arguments so f(x, pool, 7), f(x, pool, days=7) and
+        # f(x, pool) with a default of 7 share one entry
+        bound = signature.bind(scope_id, conn, *args, **kwargs)
+        bound.apply_defaults()
+        key = (func.__name__, tuple(
+            (name, value) for name, value in bound.arguments.items() if name != conn_param
+        ))
+
+        while True:
+            cached = _dashboard_cache.get(key)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+
+            pending = _dashboard_inflight.get(key)
+            if pending is None:
+                break
+            try:
+                return await asyncio.shield(pending)
+            except _LeaderCancelled:
+                continue
+
+        generation = _dashboard_generation
+        future = asyncio.get_running_loop().create_future()
+        _dashboard_inflight[key] = future
+        try:
+            result = await func(scope_id, conn, *args, **kwargs)
+        except asyncio.CancelledError:
+            # Only this caller was cancelled: wake waiters so one of them re-runs the query
+            future.set_exception(_LeaderCancelled())
+            future.exception()  # Mark retrieved when no other caller is waiting
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when no other caller is waiting
+            raise
+        finally:
+            if _dashboard_inflight.get(key) is future:
+                del _dashboard_inflight[key]
+
+        if generation == _dashboard_generation:
+            now = time.monotonic()
+            if len(_dashboard_cache) >= DASHBOARD_CACHE_MAX_ENTRIES:
+                for stale_key in [k for k, (expires, _) in _dashboard_cache.items() if expires <= now]:
+                    del _dashboard_cache[stale_key]
+                if len(_dashboard_cache) >= DASHBOARD_CACHE_MAX_ENTRIES:
+                    _dashboard_cache.pop(next(iter(_dashboard_cache)))
+
+            _dashboard_cache[key] = (now + DASHBOARD_CACHE_TTL_SECONDS, result)
+
+        future.set_result(result)
+        return result
+
+    return wrapper
+
+
+def _json_loads(value: str) -> Any:
+    """Decode a JSON aggregate returned by Postgres (orjson when installed)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+async def _fetch(
+    db: Union[asyncpg.Pool, asyncpg.Connection],
+    query: str,
+    *args
+) -> List[asyncpg.Record]:
+    """Run a query on its own pooled connection, or directly on a single connection"""
+    if isinstance(db, asyncpg.Pool):
+        async with db.acquire() as conn:
+            return await conn.fetch(query, *args)
+    return await db.fetch(query, *args)
+
+
+async def _gather(db: Union[asyncpg.Pool, asyncpg.Connection], *queries: Awaitable) -> List[Any]:
+    """
+    Await independent queries, concurrently when db is a pool.
+
+    A single connection can only run one query at a time, so queries given a
+    connection (e.g. by the monitoring scheduler) are awaited one by one.
+    """
+    if isinstance(db, asyncpg.Pool):
+        return list(await asyncio.gather(*queries))
+    return [await query for query in queries]
+
 
 class AlertSeverity(str, Enum):
     CRITICAL = "critical"
@@ -39,13 +179,16 @@ class AlertType(str, Enum):
     CONTROL_NOT_MET = "control_not_met"
 
 
+@ttl_cached
 async def get_dashboard_summary(
     organization_id: str,
-    conn: asyncpg.Connection
+    pool: Union[asyncpg.Pool, asyncpg.Connection]
 ) -> Dict[str, Any]:
     """
     Get high-level dashboard summary for an organization.
 
+    Accepts a pool (API) or a single connection (monitoring scheduler).
+
     Returns:
         Dashboard summary including:
         - Total assessments
@@ -58,126 +201,115 @@ async def get_dashboard_summary(
     """
     logger.info(f"Generating dashboard summary for organization {organization_id}")
 
-    # Get assessment statistics
-    assessment_stats = await conn.fetchrow(
-        """
-        SELECT
-            COUNT(*) as total_assessments,
-            COUNT(*) FILTER (WHERE status IN ('in_progress', 'under_review')) as active_assessments,
-            COUNT(*) FILTER (WHERE status = 'complete') as completed_assessments
-        FROM assessments
-        WHERE organization_id = $1
-        """,
-        organization_id
-    )
-
-    # Get latest SPRS score across all assessments
-    latest_sprs = await conn.fetchrow(
-        """
-        SELECT
-            AVG(s.score) as avg_score,
-            MAX(s.score) as max_score,
-            MIN(s.score) as min_score
-        FROM sprs_scores s
-        JOIN assessments a ON s.assessment_id = a.id
-        WHERE a.organization_id = $1
-            AND s.calculation_date >= NOW() - INTERVAL '30 days'
-        """,
-        organization_id
-    )
-
-    # Get control compliance statistics
-    control_stats = await conn.fetchrow(
-        """
-        SELECT
-            COUNT(*) as total_findings,
-            COUNT(*) FILTER (WHERE status = 'Met') as met,
-            COUNT(*) FILTER (WHERE status = 'Partially Met') as partially_met,
-            COUNT(*) FILTER (WHERE status = 'Not Met') as not_met,
-            COUNT(*) FILTER (WHERE status = 'Not Assessed') as not_assessed
-        FROM control_findings cf
-        JOIN assessments a ON cf.assessment_id = a.id
-        WHERE a.organization_id = $1
-        """,
-        organization_id
+    # These queries are independent, so run them concurrently on separate
+    # pooled connections when given a pool
+    stats, recent_alerts = await _gather(
+        pool,
+        # All summary statistics in one round trip; each CTE scans only this
+        # organization's assessments
+        pool.fetchrow(
+            """
+            WITH org_assessments AS (
+                SELECT id, status
+                FROM assessments
+                WHERE organization_id = $1
+            ),
+            assessment_stats AS (
+                SELECT
+                    COUNT(*) as total_assessments,
+                    COUNT(*) FILTER (WHERE status IN ('in_progress', 'under_review')) as active_assessments,
+                    COUNT(*) FILTER (WHERE status = 'complete') as completed_assessments
+                FROM org_assessments
+            ),
+            sprs_stats AS (
+                SELECT
+                    AVG(s.score) as avg_score,
+                    MAX(s.score) as max_score,
+                    MIN(s.score) as min_score
+                FROM sprs_scores s
+                JOIN org_assessments a ON s.assessment_id = a.id
+                WHERE s.calculation_date >= NOW() - INTERVAL '30 days'
+            ),
+            control_stats AS (
+                SELECT
+                    COUNT(*) as total_findings,
+                    COUNT(*) FILTER (WHERE cf.status = 'Met') as met,
+                    COUNT(*) FILTER (WHERE cf.status = 'Partially Met') as partially_met,
+                    COUNT(*) FILTER (WHERE cf.status = 'Not Met') as not_met,
+                    COUNT(*) FILTER (WHERE cf.status = 'Not Assessed') as not_assessed
+                FROM control_findings cf
+                JOIN org_assessments a ON cf.assessment_id = a.id
+            ),
+            evidence_stats AS (
+                SELECT
+                    COUNT(*) as total_evidence,
+                    COUNT(*) FILTER (WHERE e.status = 'approved') as evidence_approved,
+                    COUNT(*) FILTER (WHERE e.status = 'pending_review') as evidence_pending,
+                    COUNT(*) FILTER (WHERE e.status = 'rejected') as evidence_rejected
+                FROM evidence e
+                JOIN org_assessments a ON e.assessment_id = a.id
+            ),
+            poam_stats AS (
+                SELECT
+                    COUNT(*) as total_poams,
+                    COUNT(*) FILTER (WHERE p.status = 'open') as poam_open,
+                    COUNT(*) FILTER (WHERE p.status = 'in_progress') as poam_in_progress,
+                    COUNT(*) FILTER (WHERE p.status = 'completed') as poam_completed,
+                    COUNT(*) FILTER (WHERE p.estimated_completion_date < CURRENT_DATE AND p.status != 'completed') as poam_overdue
+                FROM poam_items p
+                JOIN org_assessments a ON p.assessment_id = a.id
+            )
+            SELECT *
+            FROM assessment_stats, sprs_stats, control_stats, evidence_stats, poam_stats
+            """,
+            organization_id
+        ),
+        # Recent alerts (last 7 days)
+        get_recent_alerts(organization_id, pool, days=7)
     )
 
     # Calculate compliance percentage
-    total_findings = control_stats['total_findings'] or 0
-    met = control_stats['met'] or 0
-    partially_met = control_stats['partially_met'] or 0
+    total_findings = stats['total_findings'] or 0
+    met = stats['met'] or 0
+    partially_met = stats['partially_met'] or 0
 
     compliance_percentage = 0.0
     if total_findings > 0:
         compliance_percentage = ((met + (partially_met * 0.5)) / total_findings) * 100
 
-    # Get evidence statistics
-    evidence_stats = await conn.fetchrow(
-        """
-        SELECT
-            COUNT(*) as total_evidence,
-            COUNT(*) FILTER (WHERE status = 'approved') as approved,
-            COUNT(*) FILTER (WHERE status = 'pending_review') as pending,
-            COUNT(*) FILTER (WHERE status = 'rejected') as rejected
-        FROM evidence e
-        JOIN assessments a ON e.assessment_id = a.id
-        WHERE a.organization_id = $1
-        """,
-        organization_id
-    )
-
-    # Get POA&M statistics
-    poam_stats = await conn.fetchrow(
-        """
-        SELECT
-            COUNT(*) as total_poams,
-            COUNT(*) FILTER (WHERE status = 'open') as open,
-            COUNT(*) FILTER (WHERE status = 'in_progress') as in_progress,
-            COUNT(*) FILTER (WHERE status = 'completed') as completed,
-            COUNT(*) FILTER (WHERE estimated_completion_date < CURRENT_DATE AND status != 'completed') as overdue
-        FROM poam_items p
-        JOIN assessments a ON p.assessment_id = a.id
-        WHERE a.organization_id = $1
-        """,
-        organization_id
-    )
-
-    # Get recent alerts (last 7 days)
-    recent_alerts = await get_recent_alerts(organization_id, conn, days=7)
-
     return {
         'organization_id': organization_id,
         'timestamp': datetime.utcnow().isoformat(),
         'assessments': {
-            'total': assessment_stats['total_assessments'] or 0,
-            'active': assessment_stats['active_assessments'] or 0,
-            'completed': assessment_stats['completed_assessments'] or 0
+            'total': stats['total_assessments'] or 0,
+            'active': stats['active_assessments'] or 0,
+            'completed': stats['completed_assessments'] or 0
         },
         'sprs_score': {
-            'average': round(float(latest_sprs['avg_score'] or 0), 2),
-            'highest': latest_sprs['max_score'] or 0,
-            'lowest': latest_sprs['min_score'] or 0
+            'average': round(float(stats['avg_score'] or 0), 2),
+            'highest': stats['max_score'] or 0,
+            'lowest': stats['min_score'] or 0
         },
         'compliance': {
             'percentage': round(compliance_percentage, 2),
             'total_controls': total_findings,
             'met': met,
             'partially_met': partially_met,
-            'not_met': control_stats['not_met'] or 0,
-            'not_assessed': control_stats['not_assessed'] or 0
+            'not_met': stats['not_met'] or 0,
+            'not_assessed': stats['not_assessed'] or 0
         },
         'evidence': {
-            'total': evidence_stats['total_evidence'] or 0,
-            'approved': evidence_stats['approved'] or 0,
-            'pending': evidence_stats['pending'] or 0,
-            'rejected': evidence_stats['rejected'] or 0
+            'total': stats['total_evidence'] or 0,
+            'approved': stats['evidence_approved'] or 0,
+            'pending': stats['evidence_pending'] or 0,
+            'rejected': stats['evidence_rejected'] or 0
         },
         'poam': {
-            'total': poam_stats['total_poams'] or 0,
-            'open': poam_stats['open'] or 0,
-            'in_progress': poam_stats['in_progress'] or 0,
-            'completed': poam_stats['completed'] or 0,
-            'overdue': poam_stats['overdue'] or 0
+            'total': stats['total_poams'] or 0,
+            'open': stats['poam_open'] or 0,
+            'in_progress': stats['poam_in_progress'] or 0,
+            'completed': stats['poam_completed'] or 0,
+            'overdue': stats['poam_overdue'] or 0
         },
         'alerts': {
             'count': len(recent_alerts),
@@ -186,9 +318,10 @@ async def get_dashboard_summary(
     }
 
 
+@ttl_cached
 async def get_control_compliance_overview(
     assessment_id: str,
-    conn: asyncpg.Connection
+    pool: asyncpg.Pool
 ) -> Dict[str, Any]:
     """
     Get detailed control compliance overview for an assessment.
@@ -198,88 +331,73 @@ async def get_control_compliance_overview(
     """
     logger.info(f"Getting control compliance overview for assessment {assessment_id}")
 
-    # Get compliance by family
-    family_compliance = await conn.fetch(
-        """
-        SELECT
-            c.family,
-            COUNT(*) as total,
-            COUNT(*) FILTER (WHERE cf.status = 'Met') as met,
-            COUNT(*) FILTER (WHERE cf.status = 'Partially Met') as partially_met,
-            COUNT(*) FILTER (WHERE cf.status = 'Not Met') as not_met,
-            COUNT(*) FILTER (WHERE cf.status = 'Not Assessed') as not_assessed
-        FROM controls c
-        LEFT JOIN control_findings cf ON c.id = cf.control_id AND cf.assessment_id = $1
-        WHERE c.framework = 'NIST 800-171'
-        GROUP BY c.family
-        ORDER BY c.family
-        """,
-        assessment_id
+    # These queries are independent, so run them concurrently on separate
+    # pooled connections rather than back to back on one
+    family_compliance, non_compliant = await _gather(
+        pool,
+        # Compliance by family
+        _fetch(
+            pool,
+            """
+            SELECT
+                c.family,
+                COUNT(*) as total,
+                COUNT(*) FILTER (WHERE cf.status = 'Met') as met,
+                COUNT(*) FILTER (WHERE cf.status = 'Partially Met') as partially_met,
+                COUNT(*) FILTER (WHERE cf.status = 'Not Met') as not_met,
+                COUNT(*) FILTER (WHERE cf.status = 'Not Assessed') as not_assessed,
+                COALESCE(ROUND(
+                    (COUNT(*) FILTER (WHERE cf.status = 'Met')
+                     + COUNT(*) FILTER (WHERE cf.status = 'Partially Met') * 0.5)
+                    / NULLIF(COUNT(*), 0) * 100,
+                    2
+                ), 0)::float as compliance_percentage
+            FROM controls c
+            LEFT JOIN control_findings cf ON c.id = cf.control_id AND cf.assessment_id = $1
+            WHERE c.framework = 'NIST 800-171'
+            GROUP BY c.family
+            ORDER BY c.family
+            """,
+            assessment_id
+        ),
+        # Top non-compliant controls
+        _fetch(
+            pool,
+            """
+            SELECT
+                cf.control_id,
+                c.title,
+                c.family,
+                cf.status,
+                cf.ai_confidence_score as confidence,
+                EXISTS(SELECT 1 FROM poam_items WHERE finding_id = cf.id) as has_poam
+            FROM control_findings cf
+            JOIN controls c ON cf.control_id = c.id
+            WHERE cf.assessment_id = $1
+                AND cf.status IN ('Not Met', 'Partially Met')
+            ORDER BY
+                CASE cf.status
+                    WHEN 'Not Met' THEN 1
+                    WHEN 'Partially Met' THEN 2
+                END,
+                cf.ai_confidence_score DESC
+            LIMIT 10
+            """,
+            assessment_id
+        )
     )
 
-    families = []
-    for row in family_compliance:
-        total = row['total'] or 0
-        met = row['met'] or 0
-        partially_met = row['partially_met'] or 0
-
-        compliance_pct = 0.0
-        if total > 0:
-            compliance_pct = ((met + (partially_met * 0.5)) / total) * 100
-
-        families.append({
-            'family': row['family'],
-            'total': total,
-            'met': met,
-            'partially_met': partially_met,
-            'not_met': row['not_met'] or 0,
-            'not_assessed': row['not_assessed'] or 0,
-            'compliance_percentage': round(compliance_pct, 2)
-        })
-
-    # Get top non-compliant controls
-    non_compliant = await conn.fetch(
-        """
-        SELECT
-            cf.control_id,
-            c.title,
-            c.family,
-            cf.status,
-            cf.ai_confidence_score,
-            EXISTS(SELECT 1 FROM poam_items WHERE finding_id = cf.id) as has_poam
-        FROM control_findings cf
-        JOIN controls c ON cf.control_id = c.id
-        WHERE cf.assessment_id = $1
-            AND cf.status IN ('Not Met', 'Partially Met')
-        ORDER BY
-            CASE cf.status
-                WHEN 'Not Met' THEN 1
-                WHEN 'Partially Met' THEN 2
-            END,
-            cf.ai_confidence_score DESC
-        LIMIT 10
-        """,
-        assessment_id
-    )
+    families = [dict(row) for row in family_compliance]
 
     return {
         'assessment_id': assessment_id,
         'timestamp': datetime.utcnow().isoformat(),
         'family_breakdown': families,
-        'top_non_compliant_controls': [
-            {
-                'control_id': row['control_id'],
-                'title': row['title'],
-                'family': row['family'],
-                'status': row['status'],
-                'confidence': row['ai_confidence_score'],
-                'has_poam': row['has_poam']
-            }
-            for row in non_compliant
-        ]
+        'top_non_compliant_controls': [dict(row) for row in non_compliant]
     }
 
 
+@ttl_cached
 async def get_recent_activity(
     organization_id: str,
     conn: asyncpg.Connection,
@@ -332,6 +450,7 @@ async def get_recent_activity(
     return activity_feed
 
 
+@ttl_cached
 async def get_integration_status(
     organization_id: str,
     conn: asyncpg.Connection
@@ -400,9 +519,10 @@ async def get_integration_status(
     }
 
 
+@ttl_cached
 async def get_risk_metrics(
     assessment_id: str,
-    conn: asyncpg.Connection
+    pool: asyncpg.Pool
 ) -> Dict[str, Any]:
     """
     Get risk metrics for an assessment.
@@ -416,17 +536,64 @@ async def get_risk_metrics(
     """
     logger.info(f"Getting risk metrics for assessment {assessment_id}")
 
-    # Get POA&M risk distribution
-    poam_risk = await conn.fetch(
-        """
-        SELECT
-            risk_level,
-            COUNT(*) as count
-        FROM poam_items
-        WHERE assessment_id = $1
-        GROUP BY risk_level
-        """,
-        assessment_id
+    # These queries are independent, so run them concurrently on separate
+    # pooled connections rather than back to back on one
+    poam_risk, critical_findings, overdue_poams = await _gather(
+        pool,
+        # POA&M risk distribution
+        _fetch(
+            pool,
+            """
+            SELECT
+                risk_level,
+                COUNT(*) as count
+            FROM poam_items
+            WHERE assessment_id = $1
+            GROUP BY risk_level
+            """,
+            assessment_id
+        ),
+        # Critical findings
+        _fetch(
+            pool,
+            """
+            SELECT
+                cf.control_id,
+                c.title,
+                cf.status,
+                cf.assessor_narrative as narrative
+            FROM control_findings cf
+            JOIN controls c ON cf.control_id = c.id
+            WHERE cf.assessment_id = $1
+                AND cf.status = 'Not Met'
+                AND EXISTS(
+                    SELECT 1 FROM poam_items p
+                    WHERE p.finding_id = cf.id AND p.risk_level = 'Critical'
+                )
+            LIMIT 10
+            """,
+            assessment_id
+        ),
+        # Overdue POA&Ms
+        _fetch(
+            pool,
+            """
+            SELECT
+                poam_id,
+                control_id,
+                weakness_description as description,
+                risk_level,
+                to_char(estimated_completion_date, 'YYYY-MM-DD') as due_date,
+                CURRENT_DATE - estimated_completion_date as days_overdue
+            FROM poam_items
+            WHERE assessment_id = $1
+                AND status != 'completed'
+                AND estimated_completion_date < CURRENT_DATE
+            ORDER BY estimated_completion_date ASC
+            LIMIT 10
+            """,
+            assessment_id
+        )
     )
 
     risk_distribution = {
@@ -439,47 +606,6 @@ async def get_risk_metrics(
         if row['risk_level'] in risk_distribution:
             risk_distribution[row['risk_level']] = row['count']
 
-    # Get critical findings
-    critical_findings = await conn.fetch(
-        """
-        SELECT
-            cf.control_id,
-            c.title,
-            cf.status,
-            cf.assessor_narrative
-        FROM control_findings cf
-        JOIN controls c ON cf.control_id = c.id
-        WHERE cf.assessment_id = $1
-            AND cf.status = 'Not Met'
-            AND EXISTS(
-                SELECT 1 FROM poam_items p
-                WHERE p.finding_id = cf.id AND p.risk_level = 'Critical'
-            )
-        LIMIT 10
-        """,
-        assessment_id
-    )
-
-    # Get overdue POA&Ms
-    overdue_poams = await conn.fetch(
-        """
-        SELECT
-            poam_id,
-            control_id,
-            weakness_description,
-            risk_level,
-            estimated_completion_date,
-            CURRENT_DATE - estimated_completion_date as days_overdue
-        FROM poam_items
-        WHERE assessment_id = $1
-            AND status != 'completed'
-            AND estimated_completion_date < CURRENT_DATE
-        ORDER BY estimated_completion_date ASC
-        LIMIT 10
-        """,
-        assessment_id
-    )
-
     # Calculate overall risk score (0-100, higher is riskier)
     total_risk = (
         risk_distribution['Critical'] * 4 +
@@ -495,32 +621,15 @@ async def get_risk_metrics(
         'timestamp': datetime.utcnow().isoformat(),
         'risk_score': round(risk_score, 2),
         'risk_distribution': risk_distribution,
-        'critical_findings': [
-            {
-                'control_id': row['control_id'],
-                'title': row['title'],
-                'status': row['status'],
-                'narrative': row['assessor_narrative']
-            }
-            for row in critical_findings
-        ],
-        'overdue_poams': [
-            {
-                'poam_id': row['poam_id'],
-                'control_id': row['control_id'],
-                'description': row['weakness_description'],
-                'risk_level': row['risk_level'],
-                'due_date': row['estimated_completion_date'].isoformat(),
-                'days_overdue': row['days_overdue']
-            }
-            for row in overdue_poams
-        ]
+        'critical_findings': [dict(row) for row in critical_findings],
+        'overdue_poams': [dict(row) for row in overdue_poams]
     }
 
 
+@ttl_cached
 async def get_recent_alerts(
     organization_id: str,
-    conn: asyncpg.Connection,
+    pool: Union[asyncpg.Pool, asyncpg.Connection],
     days: int = 7
 ) -> List[Dict[str, Any]]:
     """
@@ -536,24 +645,69 @@ async def get_recent_alerts(
 
     alerts = []
 
-    # Check for overdue POA&Ms
-    overdue_poams = await conn.fetch(
-        """
-        SELECT
-            p.poam_id,
-            p.control_id,
-            p.risk_level,
-            p.estimated_completion_date,
-            a.id as assessment_id
-        FROM poam_items p
-        JOIN assessments a ON p.assessment_id = a.id
-        WHERE a.organization_id = $1
-            AND p.status != 'completed'
-            AND p.estimated_completion_date < CURRENT_DATE
-            AND p.estimated_completion_date >= CURRENT_DATE - $2::int
-        """,
-        organization_id,
-        days
+    # These queries are independent, so run them concurrently on separate
+    # pooled connections rather than back to back on one
+    overdue_poams, failed_integrations, new_not_met = await _gather(
+        pool,
+        # Overdue POA&Ms
+        _fetch(
+            pool,
+            """
+            SELECT
+                p.poam_id,
+                p.control_id,
+                p.risk_level,
+                p.estimated_completion_date,
+                a.id as assessment_id
+            FROM poam_items p
+            JOIN assessments a ON p.assessment_id = a.id
+            WHERE a.organization_id = $1
+                AND p.status != 'completed'
+                AND p.estimated_completion_date < CURRENT_DATE
+                AND p.estimated_completion_date >= CURRENT_DATE - $2::int
+            """,
+            organization_id,
+            days
+        ),
+        # Failed integrations
+        _fetch(
+            pool,
+            """
+            SELECT
+                integration_type,
+                error_details,
+                started_at
+            FROM integration_runs
+            WHERE organization_id = $1
+                AND status = 'failed'
+                AND started_at >= NOW() - $2::int * INTERVAL '1 day'
+            ORDER BY started_at DESC
+            LIMIT 10
+            """,
+            organization_id,
+            days
+        ),
+        # New "Not Met" findings
+        _fetch(
+            pool,
+            """
+            SELECT
+                cf.control_id,
+                c.title,
+                cf.created_at,
+                a.id as assessment_id
+            FROM control_findings cf
+            JOIN controls c ON cf.control_id = c.id
+            JOIN assessments a ON cf.assessment_id = a.id
+            WHERE a.organization_id = $1
+                AND cf.status = 'Not Met'
+                AND cf.created_at >= NOW() - $2::int * INTERVAL '1 day'
+            ORDER BY cf.created_at DESC
+            LIMIT 10
+            """,
+            organization_id,
+            days
+        )
     )
 
     for poam in overdue_poams:
@@ -571,24 +725,6 @@ async def get_recent_alerts(
             'timestamp': datetime.utcnow().isoformat()
         })
 
-    # Check for failed integrations
-    failed_integrations = await conn.fetch(
-        """
-        SELECT
-            integration_type,
-            error_details,
-            started_at
-        FROM integration_runs
-        WHERE organization_id = $1
-            AND status = 'failed'
-            AND started_at >= NOW() - $2::int * INTERVAL '1 day'
-        ORDER BY started_at DESC
-        LIMIT 10
-        """,
-        organization_id,
-        days
-    )
-
     for integration in failed_integrations:
         alerts.append({
             'type': AlertType.INTEGRATION_FAILURE.value,
@@ -602,27 +738,6 @@ async def get_recent_alerts(
             'timestamp': integration['started_at'].isoformat()
         })
 
-    # Check for new "Not Met" findings
-    new_not_met = await conn.fetch(
-        """
-        SELECT
-            cf.control_id,
-            c.title,
-            cf.created_at,
-            a.id as assessment_id
-        FROM control_findings cf
-        JOIN controls c ON cf.control_id = c.id
-        JOIN assessments a ON cf.assessment_id = a.id
-        WHERE a.organization_id = $1
-            AND cf.status = 'Not Met'
-            AND cf.created_at >= NOW() - $2::int * INTERVAL '1 day'
-        ORDER BY cf.created_at DESC
-        LIMIT 10
-        """,
-        organization_id,
-        days
-    )
-
     for finding in new_not_met:
         alerts.append({
             'type': AlertType.CONTROL_NOT_MET.value,
@@ -642,6 +757,7 @@ async def get_recent_alerts(
     return alerts
 
 
+@ttl_cached
 async def get_evidence_statistics(
     assessment_id: str,
     conn: asyncpg.Connection
@@ -658,41 +774,26 @@ async def get_evidence_statistics(
     """
     logger.info(f"Getting evidence statistics for assessment {assessment_id}")
 
-    # Get evidence by type
-    by_type = await conn.fetch(
-        """
-        SELECT
-            evidence_type,
-            COUNT(*) as count
-        FROM evidence
-        WHERE assessment_id = $1
-        GROUP BY evidence_type
-        """,
-        assessment_id
-    )
-
-    # Get evidence by collection method
-    by_method = await conn.fetch(
-        """
-        SELECT
-            collection_method,
-            COUNT(*) as count
-        FROM evidence
-        WHERE assessment_id = $1
-        GROUP BY collection_method
-        """,
-        assessment_id
-    )
-
-    # Get evidence by status
-    by_status = await conn.fetch(
+    # Type, collection method and status breakdowns in one round trip. Each
+    # comes back as a JSON object; json_object_agg rejects NULL keys, so a
+    # missing value is keyed 'null' (what the API emitted for a None key).
+    breakdowns = await conn.fetchrow(
         """
+        WITH assessment_evidence AS (
+            SELECT evidence_type, collection_method, status
+            FROM evidence
+            WHERE assessment_id = $1
+        )
         SELECT
-            status,
-            COUNT(*) as count
-        FROM evidence
-        WHERE assessment_id = $1
-        GROUP BY status
+            (SELECT COALESCE(json_object_agg(k, n), '{}')
+             FROM (SELECT COALESCE(evidence_type, 'null') AS k, COUNT(*) AS n
+                   FROM assessment_evidence GROUP BY 1) t) AS by_type,
+            (SELECT COALESCE(json_object_agg(k, n), '{}')
+             FROM (SELECT COALESCE(collection_method, 'null') AS k, COUNT(*) AS n
+                   FROM assessment_evidence GROUP BY 1) m) AS by_method,
+            (SELECT COALESCE(json_object_agg(k, n), '{}')
+             FROM (SELECT COALESCE(status, 'null') AS k, COUNT(*) AS n
+                   FROM assessment_evidence GROUP BY 1) s) AS by_status
         """,
         assessment_id
     )
@@ -717,9 +818,9 @@ async def get_evidence_statistics(
     return {
         'assessment_id': assessment_id,
         'timestamp': datetime.utcnow().isoformat(),
-        'by_type': {row['evidence_type']: row['count'] for row in by_type},
-        'by_collection_method': {row['collection_method']: row['count'] for row in by_method},
-        'by_status': {row['status']: row['count'] for row in by_status},
+        'by_type': _json_loads(breakdowns['by_type']),
+        'by_collection_method': _json_loads(breakdowns['by_method']),
+        'by_status': _json_loads(breakdowns['by_status']),
         'recent_uploads': [
             {
                 'id': str(row['id']),
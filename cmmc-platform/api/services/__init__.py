@@ -6,6 +6,7 @@ from .embedding_service import (
     EmbeddingService,
     EmbeddingConfig,
     EmbeddingProvider,
+    EmbeddingCache,
     create_embedding_service
 )
 
@@ -20,7 +21,8 @@ from .ai_analyzer import (
 
 from .prompts import (
     CMCCPromptTemplates,
-    PromptBuilder
+    PromptBuilder,
+    count_tokens
 )
 
 
@@ -29,6 +31,7 @@ __all__ = [
     'EmbeddingService',
     'EmbeddingConfig',
     'EmbeddingProvider',
+    'EmbeddingCache',
     'create_embedding_service',
 
     # RAG
@@ -43,4 +46,5 @@ __all__ = [
     # Prompts
     'CMCCPromptTemplates',
     'PromptBuilder',
+    'count_tokens',
 ]
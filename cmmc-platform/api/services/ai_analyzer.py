@@ -96,7 +96,12 @@ class AIAnalyzer:
                 raise ImportError("openai package not installed. Run: pip install openai")
             if not config.api_key:
                 raise ValueError("OpenAI API key required")
-            self._client = openai.AsyncOpenAI(api_key=config.api_key)
+            # The client retries 429s and 5xx with jittered backoff, honoring Retry-After
+            self._client = openai.AsyncOpenAI(
+                api_key=config.api_key,
+                max_retries=config.max_retries,
+                timeout=config.timeout
+            )
             logger.info(f"Initialized OpenAI client with model: {config.model_name}")
 
         elif self.provider == AIProvider.ANTHROPIC:
@@ -104,7 +109,11 @@ class AIAnalyzer:
                 raise ImportError("anthropic package not installed. Run: pip install anthropic")
             if not config.api_key:
                 raise ValueError("Anthropic API key required")
-            self._client = anthropic.AsyncAnthropic(api_key=config.api_key)
+            self._client = anthropic.AsyncAnthropic(
+                api_key=config.api_key,
+                max_retries=config.max_retries,
+                timeout=config.timeout
+            )
             logger.info(f"Initialized Anthropic client with model: {config.model_name}")
 
         else:
@@ -4,11 +4,20 @@ Generates vector embeddings for semantic search and RAG
 """
 
 import asyncio
+import functools
+import hashlib
 import logging
-from typing import List, Optional, Dict, Any
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Tuple, AsyncIterator
 from enum import Enum
 import numpy as np
 
+from .prompts import token_counts_are_exact, truncate_to_tokens_batch
+
 # Optional imports - gracefully handle missing dependencies
 try:
     import openai
@@ -16,6 +25,18 @@ try:
 except ImportError:
     OPENAI_AVAILABLE = False
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 try:
     from sentence_transformers import SentenceTransformer
     SENTENCE_TRANSFORMERS_AVAILABLE = True
@@ -31,6 +52,57 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Runs of any whitespace (collapsed to a single space before embedding)
+WHITESPACE_RE = re.compile(r'\s+')
+
+# OpenAI rejects any single input longer than this many tokens
+MAX_INPUT_TOKENS = 8191
+# Cheap character cut applied before tokenizing, so huge documents are never
+# fully encoded (cl100k_base averages ~4 characters per token)
+MAX_CHARS_PER_TOKEN = 8
+# Allowed gap between local token counts and the API's billed usage per request
+TOKEN_COUNT_TOLERANCE = 5
+
+
+def _is_transient_error(exc: Exception) -> bool:
+    """
+    Whether a failed batch may succeed if resent as smaller requests
+
+    Rate limits are excluded: splitting would only send more requests to an
+    API that is already throttling.
+    """
+    if not OPENAI_AVAILABLE:
+        return False
+    return isinstance(exc, (
+        openai.APIConnectionError,  # includes APITimeoutError
+        openai.InternalServerError
+    ))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_sentence_transformer(model_name: str, device: Optional[str] = None):
+    """
+    Load a SentenceTransformer, shared by every service using the same model
+
+    Args:
+        model_name: Model to load
+        device: Torch device ("cpu", "cuda", ...); auto-detected when None
+
+    Returns:
+        Loaded model, in half precision when placed on CUDA
+    """
+    if device is None:
+        try:
+            import torch
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+        except ImportError:
+            device = "cpu"
+
+    model = SentenceTransformer(model_name, device=device)
+    if device.startswith("cuda"):
+        model = model.half()
+    return model
+
 
 class EmbeddingProvider(str, Enum):
     """Supported embedding providers"""
@@ -40,6 +112,96 @@ class EmbeddingProvider(str, Enum):
     LOCAL = "local"
 
 
+class EmbeddingCache:
+    """
+    Persistent embedding cache backed by SQLite
+
+    Entries are keyed by (model, sha256(text)) and vectors are stored as raw
+    float32 bytes, so re-ingesting unchanged text never reaches the API.
+    """
+
+    # Stay well under SQLite's bound-parameter limit in IN (...) lookups
+    LOOKUP_CHUNK_SIZE = 500
+
+    def __init__(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model TEXT NOT NULL,
+                text_hash BLOB NOT NULL,
+                vector BLOB NOT NULL,
+                PRIMARY KEY (model, text_hash)
+            )
+            """
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _hash(text: str) -> bytes:
+        return hashlib.sha256(text.encode("utf-8")).digest()
+
+    def get_many(self, model: str, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """
+        Look up cached embeddings
+
+        Args:
+            model: Embedding model name
+            texts: Texts to look up
+
+        Returns:
+            float32 embedding per text, or None where it is not cached
+        """
+        hashes = [self._hash(text) for text in texts]
+        unique = list(dict.fromkeys(hashes))
+        found: Dict[bytes, bytes] = {}
+
+        with self._lock:
+            for i in range(0, len(unique), self.LOOKUP_CHUNK_SIZE):
+                chunk = unique[i:i + self.LOOKUP_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT text_hash, vector FROM embeddings "
+                    f"WHERE model = ? AND text_hash IN ({placeholders})",
+                    (model, *chunk)
+                ).fetchall()
+                found.update(rows)
+
+        return [
+            np.frombuffer(found[h], dtype=np.float32) if h in found else None
+            for h in hashes
+        ]
+
+    def put_many(self, model: str, texts: List[str], embeddings: List[List[float]]) -> None:
+        """
+        Store embeddings
+
+        Args:
+            model: Embedding model name
+            texts: Texts that were embedded
+            embeddings: Embedding per text
+        """
+        rows = [
+            (model, self._hash(text), np.asarray(embedding, dtype=np.float32).tobytes())
+            for text, embedding in zip(texts, embeddings)
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, text_hash, vector) VALUES (?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
 class EmbeddingConfig:
     """Configuration for embedding service"""
 
@@ -51,7 +213,12 @@ class EmbeddingConfig:
         dimension: int = 1536,
         batch_size: int = 100,
         max_retries: int = 3,
-        timeout: int = 30
+        timeout: int = 30,
+        max_concurrency: int = 4,
+        cache_path: Optional[str] = None,
+        device: Optional[str] = None,
+        max_tokens_per_request: int = 300_000,
+        normalize: bool = True
     ):
         self.provider = provider
         self.api_key = api_key
@@ -59,6 +226,11 @@ class EmbeddingConfig:
         self.batch_size = batch_size
         self.max_retries = max_retries
         self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.cache_path = cache_path  # SQLite embedding cache (disabled when None)
+        self.device = device  # Torch device for local models (auto-detected when None)
+        self.max_tokens_per_request = max_tokens_per_request  # OpenAI caps tokens per request
+        self.normalize = normalize  # L2-normalize so similarity is a plain dot product
 
         # Set default model names based on provider
         if model_name is None:
@@ -82,11 +254,31 @@ class EmbeddingService:
     - Future: Anthropic, Cohere, custom models
     """
 
+    # In-process LRU for single-text lookups (repeated search queries)
+    MEMORY_CACHE_MAX_ENTRIES = 4096
+    MEMORY_CACHE_MAX_TEXT_LENGTH = 32_000
+
+    # Pooled keep-alive connections to the embedding API
+    HTTP_MAX_CONNECTIONS = 64
+
     def __init__(self, config: EmbeddingConfig):
         self.config = config
         self.provider = config.provider
         self._model = None
         self._client = None
+        self._http_client = None
+        # Bounds how many batches are in flight at once
+        self._semaphore = asyncio.Semaphore(max(1, config.max_concurrency))
+        self._cache = None
+        if config.cache_path:
+            try:
+                self._cache = EmbeddingCache(config.cache_path)
+            except (OSError, sqlite3.Error) as e:
+                # A missing cache only costs API calls; don't take RAG down with it
+                logger.warning(f"Embedding cache disabled, cannot open {config.cache_path}: {e}")
+        # Keyed by text only: each service embeds with a single model. float32
+        # rows take ~1/7 the memory of a list of Python floats.
+        self._memory_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
 
         # Initialize based on provider
         if self.provider == EmbeddingProvider.OPENAI:
@@ -94,7 +286,23 @@ class EmbeddingService:
                 raise ImportError("openai package not installed. Run: pip install openai")
             if not config.api_key:
                 raise ValueError("OpenAI API key required for OpenAI provider")
-            self._client = openai.AsyncOpenAI(api_key=config.api_key)
+            if HTTPX_AVAILABLE:
+                # Keep connections alive across batches (HTTP/2 multiplexing when h2 is installed)
+                self._http_client = httpx.AsyncClient(
+                    http2=HTTP2_AVAILABLE,
+                    timeout=httpx.Timeout(config.timeout, connect=5.0),
+                    limits=httpx.Limits(
+                        max_connections=self.HTTP_MAX_CONNECTIONS,
+                        max_keepalive_connections=self.HTTP_MAX_CONNECTIONS
+                    )
+                )
+            # The client retries 429s and 5xx with jittered backoff, honoring Retry-After
+            self._client = openai.AsyncOpenAI(
+                api_key=config.api_key,
+                max_retries=config.max_retries,
+                timeout=config.timeout,
+                http_client=self._http_client
+            )
             logger.info(f"Initialized OpenAI embedding service with model: {config.model_name}")
 
         elif self.provider == EmbeddingProvider.SENTENCE_TRANSFORMERS:
@@ -108,6 +316,19 @@ class EmbeddingService:
         else:
             raise ValueError(f"Unsupported embedding provider: {self.provider}")
 
+    async def aclose(self) -> None:
+        """Close the HTTP connection pool and the embedding cache"""
+        if self._client is not None:
+            await self._client.close()
+        if self._cache is not None:
+            self._cache.close()
+
+    async def __aenter__(self) -> "EmbeddingService":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
     async def _get_sentence_transformer_model(self):
         """Lazy load sentence transformer model"""
         if self._model is None:
@@ -115,10 +336,14 @@ class EmbeddingService:
             loop = asyncio.get_event_loop()
             self._model = await loop.run_in_executor(
                 None,
-                SentenceTransformer,
-                self.config.model_name
+                _load_sentence_transformer,
+                self.config.model_name,
+                self.config.device
+            )
+            logger.info(
+                f"Loaded Sentence Transformers model: {self.config.model_name} "
+                f"(device: {self._model.device})"
             )
-            logger.info(f"Loaded Sentence Transformers model: {self.config.model_name}")
         return self._model
 
     async def generate_embedding(self, text: str) -> List[float]:
@@ -131,8 +356,20 @@ class EmbeddingService:
         Returns:
             List of floats representing the embedding vector
         """
-        embeddings = await self.generate_embeddings([text])
-        return embeddings[0]
+        cached = self._memory_cache.get(text)
+        if cached is not None:
+            self._memory_cache.move_to_end(text)
+            return cached.tolist()
+
+        embedding = (await self.generate_embeddings_array([text]))[0]
+
+        # Cache mutations never span an await, so the event loop serializes them
+        if len(text) <= self.MEMORY_CACHE_MAX_TEXT_LENGTH:
+            self._memory_cache[text] = embedding
+            if len(self._memory_cache) > self.MEMORY_CACHE_MAX_ENTRIES:
+                self._memory_cache.popitem(last=False)
+
+        return embedding.tolist()
 
     async def generate_embeddings(
         self,
@@ -152,112 +389,314 @@ class EmbeddingService:
         if not texts:
             return []
 
+        embeddings = await self.generate_embeddings_array(texts, batch_size)
+        return embeddings.tolist()
+
+    async def generate_embeddings_array(
+        self,
+        texts: List[str],
+        batch_size: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Generate embeddings for multiple texts as a single matrix
+
+        Prefer this over generate_embeddings for numeric work: it avoids
+        building a Python float per vector component.
+
+        Args:
+            texts: List of input texts
+            batch_size: Override default batch size
+
+        Returns:
+            float32 array of shape (len(texts), dimension)
+        """
+        if not texts:
+            return np.empty((0, self.config.dimension), dtype=np.float32)
+
         batch_size = batch_size or self.config.batch_size
 
-        # Process in batches to avoid rate limits
-        all_embeddings = []
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
+        # Exact repeats (chunks often repeat headers and boilerplate) are
+        # dropped before tokenizing
+        raw_positions: Dict[str, int] = {}
+        raw_inverse = [raw_positions.setdefault(text, len(raw_positions)) for text in texts]
+        # Clean, truncate and count tokens in one pass off the event loop; the
+        # cleaned texts are what get sent, so batches are packed on their counts
+        loop = asyncio.get_event_loop()
+        prepared_texts, prepared_counts = await loop.run_in_executor(
+            None, self._prepare_texts, list(raw_positions)
+        )
+
+        # Embed each distinct cleaned text once: inputs that differ only in
+        # whitespace, or only past the token limit, are sent as the same text
+        positions: Dict[str, int] = {}
+        lengths: List[int] = []
+        for text, count in zip(prepared_texts, prepared_counts):
+            if text not in positions:
+                positions[text] = len(positions)
+                lengths.append(count)
+        cleaned_texts = list(positions)
+        inverse = [positions[prepared_texts[i]] for i in raw_inverse]
+        batches = self._pack_batches(lengths, batch_size)
+
+        # Run batches concurrently (bounded by max_concurrency)
+        results = await asyncio.gather(*(
+            self._generate_batch_with_split(
+                [cleaned_texts[i] for i in batch], [lengths[i] for i in batch]
+            )
+            for batch in batches
+        ))
+
+        # Scatter packed results back to unique-text order
+        embeddings = np.empty((len(cleaned_texts), results[0].shape[1]), dtype=np.float32)
+        embeddings[[i for batch in batches for i in batch]] = np.concatenate(results)
+
+        if len(cleaned_texts) == len(texts):
+            return embeddings
+
+        # Fan results back out to every input position
+        return embeddings[inverse]
+
+    async def iter_embeddings(
+        self,
+        texts: List[str],
+        batch_size: Optional[int] = None
+    ) -> AsyncIterator[Tuple[int, np.ndarray]]:
+        """
+        Generate embeddings for a large input window by window
+
+        Each window holds enough texts to keep max_concurrency batches in
+        flight, so only one window of vectors is in memory at a time.
+
+        Args:
+            texts: List of input texts
+            batch_size: Override default batch size
+
+        Yields:
+            (offset, embeddings) where row i of the float32 array embeds
+            texts[offset + i]
+        """
+        batch_size = batch_size or self.config.batch_size
+        window = batch_size * max(1, self.config.max_concurrency)
+
+        for start in range(0, len(texts), window):
+            embeddings = await self.generate_embeddings_array(texts[start:start + window], batch_size)
+            yield start, embeddings
+
+    def _pack_batches(self, lengths: List[int], batch_size: int) -> List[List[int]]:
+        """
+        Group texts into batches of similar length
+
+        Texts are sorted by token count and packed greedily, so a long document
+        is not paired with many short ones and no request exceeds either the
+        item or the token cap.
+
+        Args:
+            lengths: Token count of each text
+            batch_size: Maximum texts per batch
+
+        Returns:
+            Batches of indices into the texts
+        """
+        order = sorted(range(len(lengths)), key=lengths.__getitem__)
+
+        batches: List[List[int]] = []
+        current: List[int] = []
+        current_tokens = 0
+        for i in order:
+            if current and (
+                len(current) >= batch_size
+                or current_tokens + lengths[i] > self.config.max_tokens_per_request
+            ):
+                batches.append(current)
+                current = []
+                current_tokens = 0
+            current.append(i)
+            current_tokens += lengths[i]
+        if current:
+            batches.append(current)
+
+        return batches
+
+    async def _generate_batch_with_split(
+        self,
+        batch: List[str],
+        token_counts: List[int]
+    ) -> np.ndarray:
+        """
+        Generate embeddings for one batch, halving it once on transient failure
+
+        The client has already retried the whole batch by the time an error
+        surfaces. A timeout or 5xx on a large request may clear for smaller,
+        faster ones, so the batch is resent once as two concurrent halves.
+        The halves are not split again: if they fail too the provider is
+        most likely down, and more requests would only add load. Rate limits
+        and input errors (e.g. 400 Bad Request) are raised immediately.
+
+        Args:
+            batch: Cleaned texts to embed
+            token_counts: Token count of each text
+
+        Returns:
+            float32 array of shape (len(batch), dimension)
+        """
+        try:
+            return await self._generate_batch(batch, token_counts)
+        except Exception as e:
+            if len(batch) == 1 or not _is_transient_error(e):
+                raise
+
+        mid = len(batch) // 2
+        logger.warning(f"Embedding batch of {len(batch)} texts failed; retrying as two halves")
+        left, right = await asyncio.gather(
+            self._generate_batch(batch[:mid], token_counts[:mid]),
+            self._generate_batch(batch[mid:], token_counts[mid:])
+        )
+        return np.concatenate([left, right])
 
+    async def _generate_batch(self, batch: List[str], token_counts: List[int]) -> np.ndarray:
+        """Generate embeddings for one batch, waiting for a concurrency slot"""
+        async with self._semaphore:
             if self.provider == EmbeddingProvider.OPENAI:
-                batch_embeddings = await self._generate_openai_embeddings(batch)
+                return await self._generate_openai_embeddings(batch, token_counts)
             elif self.provider == EmbeddingProvider.SENTENCE_TRANSFORMERS:
-                batch_embeddings = await self._generate_sentence_transformer_embeddings(batch)
+                return await self._generate_sentence_transformer_embeddings(batch)
             else:
                 raise ValueError(f"Unsupported provider: {self.provider}")
 
-            all_embeddings.extend(batch_embeddings)
-
-            # Small delay between batches to respect rate limits
-            if i + batch_size < len(texts):
-                await asyncio.sleep(0.1)
-
-        return all_embeddings
-
     async def _generate_openai_embeddings(
         self,
-        texts: List[str]
-    ) -> List[List[float]]:
-        """Generate embeddings using OpenAI API"""
+        cleaned_texts: List[str],
+        token_counts: List[int]
+    ) -> np.ndarray:
+        """Generate embeddings using OpenAI API (texts already cleaned and truncated)"""
         try:
-            # Clean and truncate texts to avoid API errors
-            cleaned_texts = [self._clean_text(text) for text in texts]
+            loop = asyncio.get_event_loop()
+            if self._cache:
+                embeddings = await loop.run_in_executor(
+                    None, self._cache.get_many, self.config.model_name, cleaned_texts
+                )
+            else:
+                embeddings = [None] * len(cleaned_texts)
+
+            # Only send cache misses to the API
+            misses = [i for i, embedding in enumerate(embeddings) if embedding is None]
+            if not misses:
+                logger.debug(f"Served {len(embeddings)} OpenAI embeddings from cache")
+                return self._finalize(embeddings)
 
+            miss_texts = [cleaned_texts[i] for i in misses]
             response = await self._client.embeddings.create(
                 model=self.config.model_name,
-                input=cleaned_texts,
+                input=miss_texts,
                 encoding_format="float"
             )
 
-            embeddings = [item.embedding for item in response.data]
+            new_embeddings = [item.embedding for item in response.data]
+            for i, embedding in zip(misses, new_embeddings):
+                embeddings[i] = embedding
+
+            if self._cache:
+                await loop.run_in_executor(
+                    None, self._cache.put_many, self.config.model_name, miss_texts, new_embeddings
+                )
+
+            # Batch packing relies on local token counts; flag drift from what was billed
+            if token_counts_are_exact():
+                local_tokens = sum(token_counts[i] for i in misses)
+                if abs(local_tokens - response.usage.total_tokens) > TOKEN_COUNT_TOLERANCE:
+                    logger.warning(
+                        f"Local token count {local_tokens} differs from billed "
+                        f"{response.usage.total_tokens} (model: {self.config.model_name})"
+                    )
 
             logger.debug(
-                f"Generated {len(embeddings)} OpenAI embeddings "
+                f"Generated {len(new_embeddings)} OpenAI embeddings, {len(embeddings) - len(misses)} cached "
                 f"(model: {self.config.model_name}, tokens: {response.usage.total_tokens})"
             )
 
-            return embeddings
+            return self._finalize(embeddings)
 
         except Exception as e:
             logger.error(f"OpenAI embedding generation failed: {e}")
             raise
 
+    def _finalize(self, embeddings: List[Any]) -> np.ndarray:
+        """Stack provider vectors into a float32 matrix, L2-normalized if configured"""
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        if self.config.normalize:
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            matrix /= np.maximum(norms, 1e-12)
+        return matrix
+
     async def _generate_sentence_transformer_embeddings(
         self,
-        texts: List[str]
-    ) -> List[List[float]]:
-        """Generate embeddings using Sentence Transformers (local)"""
+        cleaned_texts: List[str]
+    ) -> np.ndarray:
+        """Generate embeddings using Sentence Transformers (local, texts already cleaned)"""
         try:
             model = await self._get_sentence_transformer_model()
 
-            # Clean texts
-            cleaned_texts = [self._clean_text(text) for text in texts]
-
-            # Run encoding in thread pool to avoid blocking
+            # Run encoding in thread pool to avoid blocking. Encode the whole batch
+            # with the model's own batching and return one float32 matrix.
             loop = asyncio.get_event_loop()
             embeddings = await loop.run_in_executor(
                 None,
-                model.encode,
-                cleaned_texts
+                functools.partial(
+                    model.encode,
+                    cleaned_texts,
+                    batch_size=self.config.batch_size,
+                    convert_to_numpy=True,
+                    normalize_embeddings=self.config.normalize,
+                    show_progress_bar=False
+                )
             )
 
-            # Convert numpy arrays to lists
-            embeddings_list = [emb.tolist() for emb in embeddings]
+            # fp16 on GPU is widened so every provider returns float32
+            embeddings = embeddings.astype(np.float32, copy=False)
 
             logger.debug(
-                f"Generated {len(embeddings_list)} local embeddings "
+                f"Generated {len(embeddings)} local embeddings "
                 f"(model: {self.config.model_name})"
             )
 
-            return embeddings_list
+            return embeddings
 
         except Exception as e:
             logger.error(f"Sentence Transformer embedding generation failed: {e}")
             raise
 
-    def _clean_text(self, text: str, max_length: int = 8000) -> str:
+    def _prepare_texts(
+        self,
+        texts: List[str],
+        max_tokens: int = MAX_INPUT_TOKENS
+    ) -> Tuple[List[str], List[int]]:
         """
-        Clean and prepare text for embedding
+        Clean texts for embedding and truncate them to the token limit
+
+        Tokenizes the whole list in one batch; run it in an executor.
 
         Args:
-            text: Input text
-            max_length: Maximum character length
+            texts: Input texts
+            max_tokens: Maximum token length per text
 
         Returns:
-            Cleaned text
+            (cleaned texts, token count of each cleaned text)
         """
-        if not text:
-            return ""
-
         # Remove excessive whitespace
-        text = " ".join(text.split())
-
-        # Truncate if too long (OpenAI has token limits)
-        if len(text) > max_length:
-            text = text[:max_length]
-            logger.warning(f"Text truncated from {len(text)} to {max_length} characters")
+        cleaned = [WHITESPACE_RE.sub(" ", text).strip() if text else "" for text in texts]
+
+        # Truncate if too long (OpenAI has token limits). The character cut keeps
+        # huge documents from being fully tokenized.
+        max_chars = max_tokens * MAX_CHARS_PER_TOKEN
+        truncated, counts = truncate_to_tokens_batch([text[:max_chars] for text in cleaned], max_tokens)
+        for before, after in zip(cleaned, truncated):
+            if len(after) < len(before):
+                logger.warning(
+                    f"Text truncated from {len(before)} to {len(after)} characters "
+                    f"({max_tokens} token limit)"
+                )
 
-        return text
+        return truncated, counts
 
     async def cosine_similarity(
         self,
@@ -274,8 +713,8 @@ class EmbeddingService:
         Returns:
             Similarity score (0-1, higher is more similar)
         """
-        vec1 = np.array(embedding1)
-        vec2 = np.array(embedding2)
+        vec1 = np.asarray(embedding1)
+        vec2 = np.asarray(embedding2)
 
         dot_product = np.dot(vec1, vec2)
         norm1 = np.linalg.norm(vec1)
@@ -304,19 +743,30 @@ class EmbeddingService:
         Returns:
             List of dicts with 'index' and 'similarity' keys
         """
-        similarities = []
+        if len(candidate_embeddings) == 0 or top_k <= 0:
+            return []
+
+        # Score every candidate with one matrix-vector product; float32 halves the
+        # memory traffic of float64 and is ample precision for ranking
+        candidates = np.asarray(candidate_embeddings, dtype=np.float32)
+        query = np.asarray(query_embedding, dtype=np.float32)
 
-        for idx, candidate in enumerate(candidate_embeddings):
-            similarity = await self.cosine_similarity(query_embedding, candidate)
-            similarities.append({
-                'index': idx,
-                'similarity': similarity
-            })
+        norms = np.linalg.norm(candidates, axis=1) * np.linalg.norm(query)
+        dots = candidates @ query
+        similarities = np.divide(dots, norms, out=np.zeros_like(dots), where=norms != 0)
 
-        # Sort by similarity (descending)
-        similarities.sort(key=lambda x: x['similarity'], reverse=True)
+        # Partially select the top k, then sort only those (stable for ties, like before)
+        top_k = min(top_k, len(similarities))
+        if top_k < len(similarities):
+            top = np.argpartition(-similarities, top_k - 1)[:top_k]
+        else:
+            top = np.arange(len(similarities))
+        top = top[np.lexsort((top, -similarities[top]))]
 
-        return similarities[:top_k]
+        return [
+            {'index': int(idx), 'similarity': float(similarities[idx])}
+            for idx in top
+        ]
 
     async def healthcheck(self) -> Dict[str, Any]:
         """
@@ -327,7 +777,20 @@ class EmbeddingService:
         """
         try:
             test_text = "This is a test embedding for CMMC compliance."
-            embedding = await self.generate_embedding(test_text)
+
+            # Call the provider directly; generate_embedding could be answered
+            # from the memory or SQLite cache while the provider is down
+            if self.provider == EmbeddingProvider.OPENAI:
+                response = await self._client.embeddings.create(
+                    model=self.config.model_name,
+                    input=[test_text],
+                    encoding_format="float"
+                )
+                embedding = response.data[0].embedding
+            elif self.provider == EmbeddingProvider.SENTENCE_TRANSFORMERS:
+                embedding = (await self._generate_sentence_transformer_embeddings([test_text]))[0]
+            else:
+                raise ValueError(f"Unsupported provider: {self.provider}")
 
             return {
                 "status": "healthy",
@@ -349,7 +812,9 @@ class EmbeddingService:
 def create_embedding_service(
     provider: str = "openai",
     api_key: Optional[str] = None,
-    model_name: Optional[str] = None
+    model_name: Optional[str] = None,
+    cache_path: Optional[str] = None,
+    max_concurrency: int = 4
 ) -> EmbeddingService:
     """
     Factory function to create embedding service
@@ -358,6 +823,8 @@ def create_embedding_service(
         provider: "openai" or "sentence_transformers"
         api_key: API key for cloud providers
         model_name: Optional model override
+        cache_path: SQLite file for the persistent embedding cache (disabled when None)
+        max_concurrency: Maximum number of batches embedded at once
 
     Returns:
         Configured EmbeddingService instance
@@ -380,7 +847,9 @@ def create_embedding_service(
     config = EmbeddingConfig(
         provider=provider_enum,
         model_name=model_name,
-        api_key=api_key
+        api_key=api_key,
+        cache_path=cache_path,
+        max_concurrency=max_concurrency
     )
 
     return EmbeddingService(config)
@@ -3,8 +3,91 @@ CMMC Compliance Platform - AI Prompt Templates
 Assessor-grade prompts for NIST SP 800-171 control analysis
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
+from functools import lru_cache
+
+# Optional imports - gracefully handle missing dependencies
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+
+@lru_cache(maxsize=1)
+def _get_token_encoding():
+    """Load the cl100k_base encoding (GPT-4 family), or None if unavailable"""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # Encoding files are fetched on first use; fall back if offline
+        return None
+
+
+def token_counts_are_exact() -> bool:
+    """Whether count_tokens uses the real tokenizer rather than the length estimate"""
+    return _get_token_encoding() is not None
+
+
+# Only strings up to this length are memoized, so the cache never pins whole
+# documents in memory (worst case ~1024 * 4096 characters)
+COUNT_TOKENS_CACHE_MAX_LENGTH = 4096
+
+
+def _count_tokens_uncached(text: str) -> int:
+    encoding = _get_token_encoding()
+    if encoding is None:
+        return len(text) // 4
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+_count_tokens_cached = lru_cache(maxsize=1024)(_count_tokens_uncached)
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count tokens in text, caching results for repeated short strings
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Exact cl100k_base token count, or ~4 characters per token without tiktoken
+    """
+    if len(text) > COUNT_TOKENS_CACHE_MAX_LENGTH:
+        return _count_tokens_uncached(text)
+    return _count_tokens_cached(text)
+
+
+def truncate_to_tokens_batch(texts: List[str], max_tokens: int) -> Tuple[List[str], List[int]]:
+    """
+    Cut each text to at most max_tokens tokens, counting tokens in the same pass
+
+    Args:
+        texts: Texts to truncate
+        max_tokens: Token budget per text
+
+    Returns:
+        (texts, token counts): each text decoded from its first max_tokens
+        cl100k_base tokens, or its first ~4 characters per token without tiktoken
+    """
+    encoding = _get_token_encoding()
+    if encoding is None:
+        truncated = [text[:max_tokens * 4] for text in texts]
+        return truncated, [len(text) // 4 for text in truncated]
+
+    truncated = []
+    counts = []
+    for text, tokens in zip(texts, encoding.encode_batch(texts, disallowed_special=())):
+        if len(tokens) > max_tokens:
+            tokens = tokens[:max_tokens]
+            text = encoding.decode(tokens)
+        truncated.append(text)
+        counts.append(len(tokens))
+    return truncated, counts
 
 
 class CMCCPromptTemplates:
@@ -539,6 +622,5 @@ class PromptBuilder:
         return messages
 
     def token_count_estimate(self, text: str) -> int:
-        """Rough estimate of token count (actual count requires tiktoken)"""
-        # Rough heuristic: 1 token ≈ 4 characters for English
-        return len(text) // 4
+        """Token count for text (exact with tiktoken, otherwise ~4 characters per token)"""
+        return count_tokens(text)
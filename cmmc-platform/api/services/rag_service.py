@@ -4,14 +4,33 @@ Retrieval-Augmented Generation for control analysis
 """
 
 import asyncpg
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Sequence
 from datetime import datetime
 from .embedding_service import EmbeddingService
 
 
 logger = logging.getLogger(__name__)
 
+UPDATE_CHUNK_EMBEDDING_SQL = "UPDATE document_chunks SET embedding = $1 WHERE id = $2"
+
+# Chunks of a document that already carry an embedding, by text digest
+EMBEDDED_CHUNK_HASHES_SQL = """
+    SELECT chunk_index, md5(chunk_text) AS text_hash
+    FROM document_chunks
+    WHERE document_id = $1 AND embedding IS NOT NULL
+"""
+
+# Upper bound on rows sent in a single executemany call
+EXECUTEMANY_BATCH_SIZE = 5000
+
+
+def _batches(rows: Sequence[Any], size: int = EXECUTEMANY_BATCH_SIZE) -> Iterator[Sequence[Any]]:
+    """Yield consecutive slices of at most `size` rows"""
+    for i in range(0, len(rows), size):
+        yield rows[i:i + size]
+
 
 class RAGService:
     """
@@ -60,9 +79,9 @@ class RAGService:
         # Generate embedding for query
         query_embedding = await self.embedding_service.generate_embedding(query)
 
-        # Build SQL query with filters
-        sql_parts = [
-            """
+        # One fixed statement for every filter combination: unused filters are
+        # passed as NULL, so asyncpg reuses a single prepared statement
+        sql = """
             SELECT
                 dc.id,
                 dc.document_id,
@@ -77,44 +96,23 @@ class RAGService:
                 1 - (dc.embedding <=> $1::vector) as similarity_score
             FROM document_chunks dc
             JOIN documents d ON dc.document_id = d.id
-            WHERE 1=1
-            """
-        ]
-
-        params = [query_embedding]
-        param_count = 1
-
-        # Add filters
-        if control_id:
-            param_count += 1
-            sql_parts.append(f"AND dc.control_id = ${param_count}")
-            params.append(control_id)
-
-        if objective_id:
-            param_count += 1
-            sql_parts.append(f"AND dc.objective_id = ${param_count}")
-            params.append(objective_id)
-
-        if assessment_id:
-            param_count += 1
-            sql_parts.append(f"AND d.assessment_id = ${param_count}")
-            params.append(assessment_id)
-
-        if method_filter:
-            param_count += 1
-            sql_parts.append(f"AND dc.method = ${param_count}")
-            params.append(method_filter)
-
-        # Add similarity threshold and ordering
-        param_count += 1
-        sql_parts.append(f"""
-            AND (1 - (dc.embedding <=> $1::vector)) >= ${param_count}
+            WHERE ($2::varchar IS NULL OR dc.control_id = $2)
+              AND ($3::varchar IS NULL OR dc.objective_id = $3)
+              AND ($4::uuid IS NULL OR d.assessment_id = $4)
+              AND ($5::varchar IS NULL OR dc.method = $5)
+              AND (1 - (dc.embedding <=> $1::vector)) >= $6
             ORDER BY similarity_score DESC
-            LIMIT {top_k}
-        """)
-        params.append(similarity_threshold)
-
-        sql = " ".join(sql_parts)
+            LIMIT $7
+        """
+        params = [
+            query_embedding,
+            control_id or None,
+            objective_id or None,
+            assessment_id or None,
+            method_filter or None,
+            similarity_threshold,
+            top_k
+        ]
 
         # Execute query
         async with self.db_pool.acquire() as conn:
@@ -271,33 +269,46 @@ class RAGService:
             logger.warning(f"No chunks created for document {document_id}")
             return 0
 
-        # Generate embeddings for all chunks
-        chunk_texts = [chunk['text'] for chunk in chunks]
+        # On re-ingest, chunks whose text is unchanged keep their stored embedding
+        async with self.db_pool.acquire() as conn:
+            existing = await conn.fetch(EMBEDDED_CHUNK_HASHES_SQL, document_id)
+        embedded = {row['chunk_index']: row['text_hash'] for row in existing}
+        pending = [
+            idx for idx, chunk in enumerate(chunks)
+            if embedded.get(idx) != hashlib.md5(chunk['text'].encode('utf-8')).hexdigest()
+        ]
+
+        if not pending:
+            logger.info(f"All {len(chunks)} chunks already embedded for document {document_id}")
+            return len(chunks)
+
+        # Generate embeddings for new or changed chunks only
+        chunk_texts = [chunks[idx]['text'] for idx in pending]
         embeddings = await self.embedding_service.generate_embeddings(chunk_texts)
 
-        # Insert chunks into database
+        # Upsert the new and changed chunks in a single batched round trip
+        rows = [
+            (document_id, idx, chunks[idx]['text'], control_id, method, doc_type, embedding)
+            for idx, embedding in zip(pending, embeddings)
+        ]
         async with self.db_pool.acquire() as conn:
-            for idx, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-                await conn.execute(
-                    """
-                    INSERT INTO document_chunks
-                    (document_id, chunk_index, chunk_text, control_id, method, doc_type, embedding)
-                    VALUES ($1, $2, $3, $4, $5, $6, $7)
-                    ON CONFLICT (document_id, chunk_index) DO UPDATE
-                    SET chunk_text = EXCLUDED.chunk_text,
-                        embedding = EXCLUDED.embedding
-                    """,
-                    document_id,
-                    idx,
-                    chunk['text'],
-                    control_id,
-                    method,
-                    doc_type,
-                    embedding
-                )
+            async with conn.transaction():
+                for batch in _batches(rows):
+                    await conn.executemany(
+                        """
+                        INSERT INTO document_chunks
+                        (document_id, chunk_index, chunk_text, control_id, method, doc_type, embedding)
+                        VALUES ($1, $2, $3, $4, $5, $6, $7)
+                        ON CONFLICT (document_id, chunk_index) DO UPDATE
+                        SET chunk_text = EXCLUDED.chunk_text,
+                            embedding = EXCLUDED.embedding
+                        """,
+                        batch
+                    )
 
         logger.info(
-            f"Created {len(chunks)} chunks with embeddings for document {document_id}"
+            f"Created {len(chunks)} chunks for document {document_id} "
+            f"({len(pending)} embedded, {len(chunks) - len(pending)} unchanged)"
         )
 
         return len(chunks)
@@ -399,17 +410,16 @@ class RAGService:
                 logger.warning(f"No chunks found for document {document_id}")
                 return 0
 
-            # Generate new embeddings
+            # Generate and write new embeddings window by window, so a large
+            # document never holds every vector in memory at once
             chunk_texts = [chunk['chunk_text'] for chunk in chunks]
-            embeddings = await self.embedding_service.generate_embeddings(chunk_texts)
-
-            # Update embeddings
-            for chunk, embedding in zip(chunks, embeddings):
-                await conn.execute(
-                    "UPDATE document_chunks SET embedding = $1 WHERE id = $2",
-                    embedding,
-                    chunk['id']
-                )
+            async for offset, embeddings in self.embedding_service.iter_embeddings(chunk_texts):
+                updates = [
+                    (embedding, chunk['id'])
+                    for chunk, embedding in zip(chunks[offset:], embeddings.tolist())
+                ]
+                for batch in _batches(updates):
+                    await conn.executemany(UPDATE_CHUNK_EMBEDDING_SQL, batch)
 
         logger.info(f"Reindexed {len(chunks)} chunks for document {document_id}")
         return len(chunks)
@@ -437,22 +447,20 @@ class RAGService:
         # For now, return a placeholder
 
         async with self.db_pool.acquire() as conn:
-            sql = """
+            rows = await conn.fetch(
+                """
                 SELECT id, title, evidence_type, control_id, file_hash,
                        collected_date, description
                 FROM evidence
                 WHERE assessment_id = $1 AND status = 'approved'
-            """
-            params = [assessment_id]
-
-            if control_id:
-                sql += " AND control_id = $2"
-                params.append(control_id)
-
-            sql += " ORDER BY collected_date DESC LIMIT $" + str(len(params) + 1)
-            params.append(top_k)
-
-            rows = await conn.fetch(sql, *params)
+                  AND ($2::varchar IS NULL OR control_id = $2)
+                ORDER BY collected_date DESC
+                LIMIT $3
+                """,
+                assessment_id,
+                control_id or None,
+                top_k
+            )
 
         return [dict(row) for row in rows]
 
@@ -0,0 +1,37 @@
+-- Migration: Composite indexes for dashboard and analytics queries
+-- The dashboard aggregates filter on (assessment_id, status) or
+-- (organization_id, ...) and only read a few narrow columns, so these
+-- indexes let Postgres answer them with index-only scans instead of
+-- scanning wide table rows.
+--
+-- CREATE INDEX CONCURRENTLY cannot run inside a transaction block; apply
+-- this file with psql in autocommit mode (the default), e.g.
+--   psql "$DATABASE_URL" -f database/migrations/002_dashboard_indexes.sql
+-- Verify with EXPLAIN (ANALYZE, BUFFERS) that "Index Only Scan" is chosen.
+
+-- Findings counted by status per assessment (summary, compliance, risk)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_findings_assessment_status
+    ON control_findings(assessment_id, status)
+    INCLUDE (control_id, ai_confidence_score);
+
+-- Evidence counted by status and listed by collection date per assessment
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_evidence_assessment_status_collected
+    ON evidence(assessment_id, status, collected_date)
+    INCLUDE (evidence_type, collection_method, control_id);
+
+-- Assessment ids and statuses per organization for the dashboard summary
+-- (filtered on organization_id only, so no created_at key column)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_assessments_org
+    ON assessments(organization_id)
+    INCLUDE (id, status);
+
+-- POA&M items counted by status and due date per assessment
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_poam_assessment_status_due
+    ON poam_items(assessment_id, status, estimated_completion_date)
+    INCLUDE (risk_level);
+
+-- Refresh planner statistics so the new indexes are considered immediately
+ANALYZE control_findings;
+ANALYZE evidence;
+ANALYZE assessments;
+ANALYZE poam_items;
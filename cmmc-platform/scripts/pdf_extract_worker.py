@@ -0,0 +1,59 @@
+"""
+CMMC Platform - PDF page extraction worker
+PDFium page-range extraction for ingest_reference_docs.py worker processes
+
+Kept apart from the ingestion script so spawned workers only need PDFium;
+the script's own imports (embedding service, models, DB driver) stay in the
+parent process.
+"""
+
+from typing import List
+
+import pypdfium2 as pdfium
+
+
+def read_pdfium_pages(pdf: pdfium.PdfDocument, start: int, stop: int) -> List[str]:
+    """
+    Extract text from pages [start, stop) of an open PDFium document
+
+    Args:
+        pdf: Open document
+        start: First page index
+        stop: Page index to stop before
+
+    Returns:
+        Page texts in page order (empty pages included)
+    """
+    page_texts = []
+    for page_index in range(start, stop):
+        page = pdf[page_index]
+        textpage = page.get_textpage()
+        try:
+            # PDFium separates lines with CRLF
+            page_texts.append(textpage.get_text_range().replace('\r\n', '\n'))
+        finally:
+            textpage.close()
+            page.close()
+    return page_texts
+
+
+def pdfium_page_texts(pdf_path: str, start: int, stop: int) -> List[str]:
+    """
+    Extract text from pages [start, stop) of a PDF file with PDFium
+
+    Runs in a worker process; PDFium is not thread-safe, so each worker
+    opens its own copy of the document.
+
+    Args:
+        pdf_path: Path to PDF file
+        start: First page index
+        stop: Page index to stop before
+
+    Returns:
+        Page texts in page order (empty pages included)
+    """
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        return read_pdfium_pages(pdf, start, stop)
+    finally:
+        pdf.close()